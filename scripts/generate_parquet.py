@@ -13,7 +13,7 @@ from pathlib import Path
 
 from clubbrugge.io import (
     load_metadata,
-    load_tracking_data,
+    stream_tracking_to_parquet,
     write_parquet,
 )
 
@@ -35,9 +35,8 @@ def main() -> None:
     meta_df = load_metadata(RAW / "metadata.json")
     write_parquet(meta_df, OUT / "metadata.parquet")
 
-    # --- tracking ----------------------------------------------------------- #
-    track_df = load_tracking_data(RAW / "tracking-produced.jsonl")
-    write_parquet(track_df, OUT / "tracking.parquet")
+    # --- tracking (streamed row-group by row-group) ------------------------- #
+    stream_tracking_to_parquet(RAW / "tracking-produced.jsonl", OUT / "tracking.parquet")
 
     print("✓ Parquet files written")
 
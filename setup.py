@@ -0,0 +1,29 @@
+"""
+Build hook for the optional Cython kernels; all metadata lives in pyproject.toml.
+
+Without Cython, or when the compiler fails, the package installs as pure Python
+and :mod:`clubbrugge.metrics` falls back to its Numba / pandas paths.
+"""
+import sys
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:                     # pragma: no cover - build without extension
+    ext_modules = []
+else:
+    openmp = ["/openmp"] if sys.platform == "win32" else ["-fopenmp"]
+    ext_modules = cythonize(
+        [
+            Extension(
+                "clubbrugge._metrics",
+                ["src/clubbrugge/_metrics.pyx"],
+                extra_compile_args=["-O3", *openmp] if sys.platform != "win32" else openmp,
+                extra_link_args=openmp if sys.platform != "win32" else [],
+                optional=True,          # a failed compile must not fail the install
+            )
+        ]
+    )
+
+setup(ext_modules=ext_modules)
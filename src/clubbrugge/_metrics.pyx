@@ -0,0 +1,107 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Ahead-of-time compiled kernels for :mod:`clubbrugge.metrics`.
+
+Optional: built by ``setup.py`` when Cython is available, otherwise the
+Numba / pandas paths in :mod:`clubbrugge.metrics` are used instead.
+"""
+import os
+
+import numpy as np
+
+from cython.parallel import prange
+from libc.math cimport isnan, sqrtf
+
+# rows per parallel block below which threading isn't worth it
+MIN_BLOCK_ROWS = 65536
+
+
+def total_distance_c(
+    const long long[::1] codes,
+    const float[::1] x,
+    const float[::1] y,
+    Py_ssize_t n_players,
+):
+    """
+    Metres covered per player code; ``codes`` are ``0..n_players-1`` (``-1`` = missing).
+
+    Rows are cut into contiguous blocks scanned in parallel with OpenMP, each
+    keeping per-player partial sums plus its first and last position; the
+    steps across block borders are stitched in afterwards, so the frame-ordered
+    rows need no per-player sort.  Steps touching a NaN position count as zero.
+    """
+    cdef Py_ssize_t n = codes.shape[0]
+    # bounds checks are compiled out, so validate the inputs once up front
+    if x.shape[0] != n or y.shape[0] != n:
+        raise ValueError("codes, x and y must have the same length")
+    if n and np.asarray(codes).max() >= n_players:
+        raise ValueError("codes must be smaller than n_players")
+    cdef Py_ssize_t n_blocks = max(1, min(os.cpu_count() or 1, n // MIN_BLOCK_ROWS))
+    cdef Py_ssize_t b, k
+
+    acc_arr = np.zeros((n_blocks, n_players), np.float64)
+    seen_arr = np.zeros((n_blocks, n_players), np.uint8)
+    first_arr = np.empty((n_blocks, n_players, 2), np.float32)
+    last_arr = np.empty((n_blocks, n_players, 2), np.float32)
+    cdef double[:, ::1] acc = acc_arr
+    cdef unsigned char[:, ::1] seen = seen_arr
+    cdef float[:, :, ::1] first = first_arr
+    cdef float[:, :, ::1] last = last_arr
+
+    for b in prange(n_blocks, nogil=True, schedule="static"):
+        _scan_block(codes, x, y, b * n // n_blocks, (b + 1) * n // n_blocks,
+                    acc[b], seen[b], first[b], last[b])
+
+    # stitch: add each player's step from one block's last to the next block's first
+    out_arr = np.zeros(n_players, np.float64)
+    cdef double[::1] out = out_arr
+    cdef float prev_x = 0, prev_y = 0, dx, dy, step
+    cdef bint has_prev
+    for k in range(n_players):
+        has_prev = False
+        for b in range(n_blocks):
+            if not seen[b, k]:
+                continue
+            out[k] += acc[b, k]
+            if has_prev:
+                dx = first[b, k, 0] - prev_x
+                dy = first[b, k, 1] - prev_y
+                step = sqrtf(dx * dx + dy * dy)
+                if not isnan(step):
+                    out[k] += step
+            prev_x = last[b, k, 0]
+            prev_y = last[b, k, 1]
+            has_prev = True
+    return out_arr
+
+
+cdef void _scan_block(
+    const long long[::1] codes,
+    const float[::1] x,
+    const float[::1] y,
+    Py_ssize_t lo,
+    Py_ssize_t hi,
+    double[::1] acc,
+    unsigned char[::1] seen,
+    float[:, ::1] first,
+    float[:, ::1] last,
+) noexcept nogil:
+    cdef Py_ssize_t i
+    cdef long long k
+    cdef float dx, dy, step
+    for i in range(lo, hi):
+        k = codes[i]
+        if k < 0:                               # missing player_id
+            continue
+        if seen[k]:
+            dx = x[i] - last[k, 0]
+            dy = y[i] - last[k, 1]
+            step = sqrtf(dx * dx + dy * dy)
+            if not isnan(step):
+                acc[k] += step
+        else:
+            seen[k] = 1
+            first[k, 0] = x[i]
+            first[k, 1] = y[i]
+        last[k, 0] = x[i]
+        last[k, 1] = y[i]
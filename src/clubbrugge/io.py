@@ -1,13 +1,73 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.json as pa_json
+import pyarrow.parquet as pq
 from tqdm import tqdm
 
+try:                                    # ~3-5x faster decode of the JSONL feed
+    import orjson as _json
+except ImportError:                     # pragma: no cover - optional speed-up
+    _json = json
+
+
+# --------------------------------------------------------------------------- #
+# Schema
+# --------------------------------------------------------------------------- #
+# player-frame columns produced by the tracking loaders, in output order;
+# float32 keeps ~cm precision on pitch coordinates at half the bytes, while
+# the epoch-ms wall clock stays int64.  Player ``z`` is ~0 throughout, so it
+# compresses to next to nothing on disk; it stays float32 because pandas'
+# float16 formatting warns on every repr.  The ~30 distinct player ids are
+# dictionary-encoded (pandas ``category``) instead of repeated strings.
+TRACKING_SCHEMA = pa.schema(
+    [
+        ("period_id", pa.int8()),
+        ("frame_index", pa.int32()),
+        ("game_clock", pa.float32()),
+        ("wall_clock", pa.int64()),
+        ("player_id", pa.dictionary(pa.int16(), pa.string())),
+        ("player_number", pa.int8()),
+        ("speed", pa.float32()),
+        ("x", pa.float32()),
+        ("y", pa.float32()),
+        ("z", pa.float32()),
+    ]
+)
+_SORT_KEYS = ["period_id", "frame_index", "player_id"]
+
+# layout of one raw tracking message, as parsed by `load_tracking_data_arrow`
+_RAW_PLAYER = pa.struct(
+    [
+        ("playerId", pa.string()),
+        ("number", pa.int64()),
+        ("xyz", pa.list_(pa.float64())),
+        ("speed", pa.float64()),
+    ]
+)
+_RAW_TRACKING_SCHEMA = pa.schema(
+    [
+        ("period", pa.int64()),
+        ("frameIdx", pa.int64()),
+        ("gameClock", pa.float64()),
+        ("wallClock", pa.int64()),
+        ("homePlayers", pa.list_(_RAW_PLAYER)),
+        ("awayPlayers", pa.list_(_RAW_PLAYER)),
+    ]
+)
+
 
 # --------------------------------------------------------------------------- #
 # Loading functions
@@ -29,22 +89,28 @@ def load_metadata(metadata_file: str | Path) -> pd.DataFrame:
     with Path(metadata_file).open("r", encoding="utf-8") as f:
         meta = json.load(f)
 
-    teams = [meta["data"]["homeTeam"], meta["data"]["awayTeam"]]
-    records: list[dict] = []
-    for team in teams:
+    team_ids: list[str] = []
+    player_ids: list[str] = []
+    names: list[str] = []
+    positions: list[str] = []
+    numbers: list[int] = []
+    for team in (meta["data"]["homeTeam"], meta["data"]["awayTeam"]):
         for p in team["players"]:
-            records.append(
-                {
-                    "team_id": team["id"],
-                    "player_id": p["id"],
-                    "player_name": p["name"],
-                    "player_position": p["position"],
-                    "player_number": int(p["number"]),
-                }
-            )
+            team_ids.append(team["id"])
+            player_ids.append(p["id"])
+            names.append(p["name"])
+            positions.append(p["position"])
+            numbers.append(int(p["number"]))
 
-    df = pd.DataFrame.from_records(records)
-    df["player_number"] = df["player_number"].astype("int16")
+    df = pd.DataFrame(
+        {
+            "team_id": team_ids,
+            "player_id": player_ids,
+            "player_name": names,
+            "player_position": positions,
+            "player_number": np.array(numbers, dtype=np.int16),
+        }
+    )
     return df
 
 
@@ -57,7 +123,7 @@ def load_tracking_data(tracking_data_file: str | Path, *, chunk_size: int = 100_
     tracking_data_file
         Path to `tracking-produced.jsonl`.
     chunk_size
-        Lines to buffer before concatenating to keep RAM usage predictable.
+        Player-frame rows to buffer before flushing to a DataFrame chunk.
 
     Returns
     -------
@@ -65,69 +131,421 @@ def load_tracking_data(tracking_data_file: str | Path, *, chunk_size: int = 100_
         Columns: ``period_id, frame_index, game_clock, wall_clock,
                   player_id, player_number, speed, x, y, z``.
     """
-    dfs: list[pd.DataFrame] = []
-    batch: list[dict] = []
-
-    with Path(tracking_data_file).open("r", encoding="utf-8") as fh:
-        for line in tqdm(fh, desc="reading tracks"):
-            obj = json.loads(line)
-
-            # skip non-tracking messages such as the "periodEnd" signal
-            if "period" not in obj:
-                continue
-
-            period = obj["period"]
-            frame = obj["frameIdx"]
-            clock = obj["gameClock"]
-            epoch_ms = obj["wallClock"]
-
-            for side in ("homePlayers", "awayPlayers"):
-                for pl in obj[side]:
-                    xyz: Iterable[float] = pl["xyz"] or (np.nan, np.nan, np.nan)
-                    batch.append(
-                        {
-                            "period_id": period,
-                            "frame_index": frame,
-                            "game_clock": clock,
-                            "wall_clock": epoch_ms,
-                            "player_id": pl["playerId"],
-                            "player_number": pl["number"],
-                            "speed": pl["speed"],
-                            "x": xyz[0],
-                            "y": xyz[1],
-                            "z": xyz[2],
-                        }
-                    )
-
-            # flush to DataFrame every chunk_size lines
-            if len(batch) >= chunk_size:
-                dfs.append(pd.DataFrame.from_records(batch))
-                batch.clear()
-
-    # final flush
-    if batch:
-        dfs.append(pd.DataFrame.from_records(batch))
-
+    dfs = [pd.DataFrame(cols) for cols in _iter_file_chunks(tracking_data_file, chunk_size)]
     df = (
         pd.concat(dfs, ignore_index=True)
-        .astype(
-            {
-                "period_id": "int8",
-                "frame_index": "int32",
-                "player_number": "int8",
-            }
-        )
-        .sort_values(["period_id", "frame_index", "player_id"])
+        .sort_values(_SORT_KEYS)
         .reset_index(drop=True)
     )
+    df["player_id"] = df["player_id"].astype("category")
+    return df
+
+
+def load_tracking_parallel(
+    tracking_data_file: str | Path,
+    *,
+    n_workers: int | None = None,
+    chunk_size: int = 100_000,
+) -> pd.DataFrame:
+    """
+    Multi-process variant of :func:`load_tracking_data`.
+
+    The file is cut into newline-aligned byte ranges of about `chunk_size`
+    rows each, which a pool of worker processes decodes.  Worth it for multi-GB feeds where JSON
+    decoding dominates; for small files the process start-up outweighs the gain.
+
+    Parameters
+    ----------
+    tracking_data_file
+        Path to `tracking-produced.jsonl`.
+    n_workers
+        Worker processes; defaults to ``os.cpu_count()``.
+    chunk_size
+        Player-frame rows per shard handed to a worker.
+
+    Returns
+    -------
+    pd.DataFrame
+        Same columns, dtypes and row order as :func:`load_tracking_data`.
+    """
+    tables = list(_iter_tracking_tables(tracking_data_file, chunk_size, n_workers))
+    df = _table_to_frame(pa.concat_tables(tables))
+    # shards are only sorted one by one; sort globally like load_tracking_data
+    return df.sort_values(_SORT_KEYS).reset_index(drop=True)
+
+
+def load_tracking_data_arrow(tracking_data_file: str | Path) -> pd.DataFrame:
+    """
+    Variant of :func:`load_tracking_data` built on ``pyarrow.json.read_json``.
+
+    Arrow's multi-threaded C++ reader parses the JSONL against
+    `_RAW_TRACKING_SCHEMA` and the player lists are exploded with compute
+    kernels, so no Python code runs per line.  The whole file is decoded at
+    once; use :func:`stream_tracking_to_parquet` when memory is tight.
+
+    Parameters
+    ----------
+    tracking_data_file
+        Path to `tracking-produced.jsonl`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Same columns, dtypes and row order as :func:`load_tracking_data`.
+    """
+    raw = pa_json.read_json(
+        tracking_data_file,
+        read_options=pa_json.ReadOptions(block_size=64 << 20),
+        parse_options=pa_json.ParseOptions(
+            explicit_schema=_RAW_TRACKING_SCHEMA,
+            unexpected_field_behavior="ignore",
+        ),
+    )
+    # skip non-tracking messages such as the "periodEnd" signal
+    raw = raw.filter(pc.is_valid(raw["period"]))
+
+    # frame-level columns repeated per player row (not the nested player lists)
+    frame_cols = raw.select(["period", "frameIdx", "gameClock", "wallClock"])
+
+    sides = []
+    for side in ("homePlayers", "awayPlayers"):
+        players = raw[side].combine_chunks()
+        frames = frame_cols.take(pc.list_parent_indices(players))
+        flat = pc.list_flatten(players)
+        # empty / incomplete xyz → null first, list_element would go out of bounds
+        xyz = flat.field("xyz")
+        xyz = pc.if_else(
+            pc.greater_equal(pc.list_value_length(xyz), 3),
+            xyz,
+            pa.scalar(None, xyz.type),
+        )
+        sides.append(
+            pa.table(
+                {
+                    "period_id": frames["period"],
+                    "frame_index": frames["frameIdx"],
+                    "game_clock": frames["gameClock"],
+                    "wall_clock": frames["wallClock"],
+                    "player_id": flat.field("playerId"),
+                    "player_number": flat.field("number"),
+                    "speed": flat.field("speed"),
+                    # missing xyz → NaN, matching the Python loader
+                    "x": pc.list_element(xyz, 0).fill_null(np.nan),
+                    "y": pc.list_element(xyz, 1).fill_null(np.nan),
+                    "z": pc.list_element(xyz, 2).fill_null(np.nan),
+                }
+            )
+        )
+
+    tbl = pa.concat_tables(sides).sort_by([(key, "ascending") for key in _SORT_KEYS])
+    return _table_to_frame(tbl.cast(TRACKING_SCHEMA))
+
+
+def stream_tracking_to_parquet(
+    tracking_data_file: str | Path,
+    parquet_file: str | Path,
+    *,
+    chunk_size: int = 500_000,
+    n_workers: int | None = 1,
+) -> None:
+    """
+    Convert tracking JSONL to Parquet one row-group at a time.
+
+    Unlike :func:`load_tracking_data` the full feed is never held in memory:
+    each chunk is sorted and appended to an open ``ParquetWriter``, so peak RSS
+    stays at roughly one chunk (two chunk-sized shards per worker when parallel).
+
+    Rows are sorted by ``period_id, frame_index, player_id`` *within each row
+    group* only.  The file as a whole is in that order only when the JSONL is
+    already in frame order, as Second Spectrum delivers it; the order-dependent
+    metrics (:func:`~clubbrugge.metrics.total_distance`,
+    :func:`~clubbrugge.metrics.count_high_speed_accel`) rely on it.  Use
+    :func:`load_tracking_data` for feeds that may be out of order.
+
+    Parameters
+    ----------
+    tracking_data_file
+        Path to `tracking-produced.jsonl`.
+    parquet_file
+        Destination Parquet file.
+    chunk_size
+        Player-frame rows per Parquet row-group (rounded up to a whole frame).
+    n_workers
+        Decode byte-range shards in this many processes (see
+        :func:`load_tracking_parallel`); ``None`` means ``os.cpu_count()``.
+    """
+    with pq.ParquetWriter(
+        parquet_file,
+        TRACKING_SCHEMA,
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=True,
+    ) as writer:
+        for tbl in _iter_tracking_tables(tracking_data_file, chunk_size, n_workers):
+            writer.write_table(tbl)         # one row-group per chunk
+
+
+def _iter_tracking_tables(
+    tracking_data_file: str | Path,
+    chunk_size: int,
+    n_workers: int | None,
+) -> Iterator[pa.Table]:
+    """
+    Yield sorted Arrow tables in file order, decoded serially or by a process pool.
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers == 1:
+        for cols in _iter_file_chunks(tracking_data_file, chunk_size):
+            yield _columns_to_table(cols)
+        return
+
+    shards = iter(_shard_byte_ranges(tracking_data_file, chunk_size))
+    pending: deque[tuple[int, Future[pa.Table]]] = deque()
+    with (
+        ProcessPoolExecutor(max_workers=n_workers) as pool,
+        _byte_progress(tracking_data_file) as pbar,
+    ):
+        while True:
+            # bounded look-ahead: at most two decoded-but-unconsumed shards per worker
+            while len(pending) < 2 * n_workers and (shard := next(shards, None)):
+                start, end = shard
+                future = pool.submit(_parse_byte_range, tracking_data_file, start, end, chunk_size)
+                pending.append((end - start, future))
+            if not pending:
+                break
+            # consume in submission order so shards stay in file order
+            n_bytes, future = pending.popleft()
+            yield future.result()
+            pbar.update(n_bytes)
+
+
+def _iter_file_chunks(
+    tracking_data_file: str | Path,
+    chunk_size: int,
+) -> Iterator[dict[str, np.ndarray]]:
+    """
+    Serially decode the whole file, advancing a byte progress bar once per chunk.
+    """
+    # binary mode: orjson decodes bytes directly (stdlib json accepts them too)
+    with Path(tracking_data_file).open("rb") as fh, _byte_progress(tracking_data_file) as pbar:
+        for cols in _iter_tracking_chunks(fh, chunk_size):
+            pbar.update(fh.tell() - pbar.n)
+            yield cols
+        pbar.update(fh.tell() - pbar.n)
+
+
+def _byte_progress(tracking_data_file: str | Path) -> tqdm:
+    """
+    Progress bar over the file size; updated per chunk, not per line, to keep
+    tqdm out of the hot loop.
+    """
+    size = Path(tracking_data_file).stat().st_size
+    return tqdm(total=size, unit="B", unit_scale=True, desc="reading tracks")
+
+
+def _shard_byte_ranges(
+    tracking_data_file: str | Path,
+    rows_per_shard: int,
+) -> list[tuple[int, int]]:
+    """
+    Split the file into ``[start, end)`` ranges cut after a newline, each holding
+    about `rows_per_shard` player-frame rows.
+    """
+    size = Path(tracking_data_file).stat().st_size
+    if size == 0:
+        return []
+    with _map_file(tracking_data_file) as mm:
+        buf = np.frombuffer(mm, dtype=np.uint8)
+        ends = _line_ends(buf)
+        del buf                                 # release the view before the map closes
+        rows_per_line = _rows_per_message(mm, ends)
+
+    # every line is one frame, so cut after a fixed number of lines
+    lines_per_shard = max(1, rows_per_shard // rows_per_line)
+    cuts = ends[lines_per_shard - 1 :: lines_per_shard]
+    offsets = np.unique(np.concatenate(([0], cuts, [size])))
+    return [(int(lo), int(hi)) for lo, hi in zip(offsets[:-1], offsets[1:])]
+
+
+def _rows_per_message(mm: mmap.mmap, ends: np.ndarray, max_lines: int = 100) -> int:
+    """
+    Player rows in the first tracking message among the leading lines (1 if none).
+    """
+    starts = np.concatenate(([0], ends[:-1]))
+    for lo, hi in zip(starts[:max_lines].tolist(), ends[:max_lines].tolist()):
+        obj = _json.loads(mm[lo:hi])
+        if "period" in obj:
+            return max(1, len(obj["homePlayers"]) + len(obj["awayPlayers"]))
+    return 1
+
+
+def _parse_byte_range(
+    tracking_data_file: str | Path,
+    start: int,
+    end: int,
+    chunk_size: int,
+) -> pa.Table:
+    """
+    Worker entry point: decode the lines in ``[start, end)`` into one sorted table.
+    """
+    with _map_file(tracking_data_file) as mm:
+        buf = np.frombuffer(mm, dtype=np.uint8, count=end - start, offset=start)
+        ends = (_line_ends(buf) + start).tolist()
+        del buf
+        # each line is handed to the decoder as a bytes slice of the map
+        lines = (mm[lo:hi] for lo, hi in zip([start] + ends[:-1], ends))
+        tables = [_columns_to_table(cols) for cols in _iter_tracking_chunks(lines, chunk_size)]
+    return pa.concat_tables(tables) if tables else TRACKING_SCHEMA.empty_table()
+
+
+def _map_file(path: str | Path) -> mmap.mmap:
+    """
+    Read-only memory map of the whole file (must not be empty).
+    """
+    with Path(path).open("rb") as fh:
+        return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _line_ends(buf: np.ndarray, block: int = 64 << 20) -> np.ndarray:
+    """
+    Offsets just past every line in `buf`, found with a vectorised newline scan.
+
+    The scan runs in blocks so the temporary boolean mask stays small; a final
+    line without a trailing newline still ends at ``len(buf)``.
+    """
+    parts = [
+        np.flatnonzero(buf[lo : lo + block] == 0x0A) + (lo + 1)
+        for lo in range(0, len(buf), block)
+    ]
+    ends = np.concatenate(parts) if parts else np.empty(0, np.int64)
+    if len(buf) and buf[-1] != 0x0A:
+        ends = np.append(ends, len(buf))
+    return ends
+
+
+def _iter_tracking_chunks(
+    lines: Iterable[bytes],
+    chunk_size: int,
+) -> Iterator[dict[str, np.ndarray]]:
+    """
+    Yield typed column arrays of roughly `chunk_size` player-frame rows.
+    """
+    # one list per output column (structure-of-arrays) – no per-row dicts
+    cols: dict[str, list] = {name: [] for name in TRACKING_SCHEMA.names}
+    period_l, frame_l, clock_l, wall_l, pid_l, pnum_l, spd_l, x_l, y_l, z_l = cols.values()
+
+    # bound methods hoisted out of the ~22-players-per-frame inner loop
+    pid_append, pnum_append, spd_append = pid_l.append, pnum_l.append, spd_l.append
+    x_append, y_append, z_append = x_l.append, y_l.append, z_l.append
+    nan3 = (np.nan, np.nan, np.nan)         # shared stand-in for a missing xyz
+
+    for line in lines:
+        obj = _json.loads(line)
+
+        # skip non-tracking messages such as the "periodEnd" signal
+        if "period" not in obj:
+            continue
+
+        home = obj["homePlayers"]
+        away = obj["awayPlayers"]
+
+        # frame-level values: one list extend per frame instead of per player
+        n = len(home) + len(away)
+        period_l += [obj["period"]] * n
+        frame_l += [obj["frameIdx"]] * n
+        clock_l += [obj["gameClock"]] * n
+        wall_l += [obj["wallClock"]] * n
+
+        for pl in chain(home, away):
+            xyz: Iterable[float] = pl["xyz"] or nan3
+            pid_append(pl["playerId"])
+            pnum_append(pl["number"])
+            spd_append(pl["speed"])
+            x_append(xyz[0])
+            y_append(xyz[1])
+            z_append(xyz[2])
+
+        # flush every chunk_size rows
+        if len(period_l) >= chunk_size:
+            yield _drain_columns(cols)
+
+    # final flush
+    if period_l:
+        yield _drain_columns(cols)
+
+
+def _table_to_frame(tbl: pa.Table) -> pd.DataFrame:
+    """
+    Convert a `TRACKING_SCHEMA` table to pandas with lexically sorted player categories.
+    """
+    df = tbl.to_pandas()
+    # dictionaries list players in order of appearance; sort like load_tracking_data
+    categories = df["player_id"].cat.categories
+    df["player_id"] = df["player_id"].cat.reorder_categories(categories.sort_values())
     return df
 
 
+def _columns_to_table(cols: dict[str, np.ndarray]) -> pa.Table:
+    """
+    Wrap one drained chunk as an Arrow table sorted by ``period_id, frame_index, player_id``.
+    """
+    # Arrow cannot sort dictionary columns, so encode player_id after sorting
+    tbl = pa.Table.from_pydict(cols)
+    tbl = tbl.sort_by([(key, "ascending") for key in _SORT_KEYS])
+    return tbl.cast(TRACKING_SCHEMA)
+
+
+def _drain_columns(cols: dict[str, list]) -> dict[str, np.ndarray]:
+    """
+    Convert per-column buffers to arrays typed per `TRACKING_SCHEMA`, then empty them.
+    """
+    arrays = {}
+    for field in TRACKING_SCHEMA:
+        typ = field.type.value_type if pa.types.is_dictionary(field.type) else field.type
+        arrays[field.name] = np.asarray(cols[field.name], dtype=typ.to_pandas_dtype())
+    for values in cols.values():
+        values.clear()
+    return arrays
+
+
 # --------------------------------------------------------------------------- #
 # Persistence helpers
 # --------------------------------------------------------------------------- #
-def write_parquet(df: pd.DataFrame, path: str | Path) -> None:
+def write_parquet(
+    df: pd.DataFrame,
+    path: str | Path,
+    *,
+    compression: str = "zstd",
+    compression_level: int | None = None,
+) -> None:
     """
     Write a DataFrame to Parquet using the 'pyarrow' engine. :contentReference[oaicite:11]{index=11}
+
+    Tracking frames are highly repetitive (player ids, periods, rounded
+    coordinates), so ZSTD with dictionary encoding gives noticeably smaller
+    files than the SNAPPY default at near-identical read speed.  The metadata
+    table is tiny, so the codec choice hardly matters there.
+
+    Parameters
+    ----------
+    df
+        DataFrame to persist (index is dropped).
+    path
+        Destination Parquet file.
+    compression
+        Parquet codec, e.g. ``"zstd"``, ``"snappy"`` or ``"none"``.
+    compression_level
+        Codec level; ``None`` means 3 for ZSTD and the codec default otherwise
+        (SNAPPY and ``"none"`` reject any level).
     """
-    df.to_parquet(path, engine="pyarrow", index=False)
+    if compression_level is None and compression.lower() == "zstd":
+        compression_level = 3
+    df.to_parquet(
+        path,
+        engine="pyarrow",
+        index=False,
+        compression=compression,
+        compression_level=compression_level,
+        use_dictionary=True,
+        row_group_size=500_000,
+    )
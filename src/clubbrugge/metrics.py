@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+import math
 from typing import Iterable
 
 import numpy as np
 import pandas as pd
 
+try:                                    # JIT kernels for the per-player scans
+    from numba import njit
+
+    _HAVE_NUMBA = True
+except ImportError:                     # pragma: no cover - optional speed-up
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):          # no-op stand-in so kernels still define
+        return lambda fn: fn
+
+try:                                    # AOT-compiled kernel: no JIT warm-up
+    from clubbrugge._metrics import total_distance_c
+except ImportError:                     # pragma: no cover - extension not built
+    total_distance_c = None
 
 # --------------------------------------------------------------------------- #
 # Helper constants
@@ -30,19 +45,23 @@ def total_distance(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Columns: ``player_id, distance_m``.
     """
-    diffs = (
-        df.groupby("player_id")[["x", "y"]]
-        .diff()                   # step-to-step delta
-        .fillna(0.0)
-    )
-    step_dist = np.hypot(diffs["x"], diffs["y"])
-    out = (
-        step_dist.groupby(df["player_id"])
-        .sum()
-        .rename("distance_m")
-        .reset_index()
-    )
-    return out
+    if total_distance_c is None and not _HAVE_NUMBA:
+        return _total_distance_pandas(df)
+
+    # integer player codes (sorted like groupby); the kernels keep per-player
+    # state indexed by code, so the frame-ordered rows never need re-sorting
+    codes, uniques = pd.factorize(df["player_id"], sort=True)
+    if total_distance_c is not None:
+        out_dist = total_distance_c(
+            codes.astype(np.int64, copy=False),
+            np.ascontiguousarray(df["x"].to_numpy(), dtype=np.float32),
+            np.ascontiguousarray(df["y"].to_numpy(), dtype=np.float32),
+            len(uniques),
+        )
+    else:
+        out_dist = np.zeros(len(uniques), np.float64)
+        _acc_dist(codes, df["x"].to_numpy(), df["y"].to_numpy(), out_dist)
+    return pd.DataFrame({"player_id": uniques, "distance_m": out_dist})
 
 
 def distance_by_speed_band(
@@ -65,18 +84,33 @@ def distance_by_speed_band(
     pd.DataFrame
         ``player_id`` plus one column per band, named ``"0-4"`` etc.
     """
-    dt = 1.0 / FPS
-    out_parts = []
-    for lo, hi in bands:
-        mask = (df["speed"] > lo) & (df["speed"] <= hi)
-        # distance = speed × time
-        dist = (df["speed"] * dt).where(mask, 0.0)
-        col = f"{lo}-{'' if np.isinf(hi) else hi}"
-        out_parts.append(
-            dist.groupby(df["player_id"]).sum().rename(col)
-        )
-
-    out = pd.concat(out_parts, axis=1).reset_index()
+    bands = list(bands)
+    lows, highs = _check_bands(bands)
+
+    # one bucket lookup for every row instead of one boolean mask per band
+    speed = df["speed"].to_numpy()
+    if speed.dtype.kind != "f":
+        speed = speed.astype(np.float64)
+    edges = np.append(lows, highs[-1]).astype(speed.dtype)
+    band_idx = np.searchsorted(edges, speed, side="left") - 1
+
+    # (lower, upper] membership; also rejects speeds in gaps between bands
+    n_bands = len(bands)
+    valid = (band_idx >= 0) & (band_idx < n_bands)
+    valid[valid] = speed[valid] <= highs[band_idx[valid]].astype(speed.dtype)
+
+    # distance = speed × time, summed per (player, band) cell in one bincount
+    codes, uniques = pd.factorize(df["player_id"], sort=True)
+    valid &= codes >= 0
+    cell = codes[valid] * n_bands + band_idx[valid]
+    dist = speed[valid].astype(np.float64) / FPS
+    sums = np.bincount(cell, weights=dist, minlength=len(uniques) * n_bands)
+
+    out = pd.DataFrame(
+        sums.reshape(len(uniques), n_bands),
+        columns=[f"{lo}-{'' if np.isinf(hi) else hi}" for lo, hi in bands],
+    )
+    out.insert(0, "player_id", uniques)
     return out
 
 
@@ -98,22 +132,124 @@ def count_high_speed_accel(
     -------
     pd.DataFrame with ``player_id, n_accel``.
     """
+    if not _HAVE_NUMBA:
+        return _count_high_speed_accel_pandas(df, min_speed=min_speed, min_accel=min_accel)
+
+    codes, uniques = pd.factorize(df["player_id"], sort=True)
+    out_n = np.zeros(len(uniques), np.int64)
+    _count_accels(codes, df["speed"].to_numpy(), min_speed, min_accel, 1.0 / FPS, out_n)
+    return pd.DataFrame({"player_id": uniques, "n_accel": out_n.astype("int16")})
+
+
+# --------------------------------------------------------------------------- #
+# Internal helpers
+# --------------------------------------------------------------------------- #
+def _check_bands(bands: list[tuple[float, float]]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Validate speed bands and return their lower and upper edges as arrays.
+
+    Shared with :mod:`clubbrugge.metrics_polars` so both backends reject the
+    same inputs.
+    """
+    lows = np.array([lo for lo, _ in bands], dtype=np.float64)
+    highs = np.array([hi for _, hi in bands], dtype=np.float64)
+    if np.any(lows[1:] < highs[:-1]) or np.any(highs <= lows):
+        raise ValueError("bands must be ascending, non-empty and non-overlapping")
+    return lows, highs
+
+
+def _total_distance_pandas(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pure-pandas fallback for :func:`total_distance` when Numba is unavailable.
+    """
+    codes, uniques = pd.factorize(df["player_id"], sort=True)
+    diffs = (
+        df[["x", "y"]]
+        .groupby(codes, sort=False)
+        .diff()                   # step-to-step delta
+        .fillna(0.0)
+    )
+    # pitch coordinates cannot overflow, so skip hypot's range-safe scalar path
+    dx = np.ascontiguousarray(diffs["x"].to_numpy(np.float64))
+    dy = np.ascontiguousarray(diffs["y"].to_numpy(np.float64))
+    step_dist = np.sqrt(dx * dx + dy * dy)
+
+    # per-player sum as one linear pass over the integer codes
+    valid = codes >= 0
+    dist = np.bincount(codes[valid], weights=step_dist[valid], minlength=len(uniques))
+    return pd.DataFrame({"player_id": uniques, "distance_m": dist})
+
+
+@njit(cache=True)
+def _acc_dist(codes, x, y, out_dist):
+    """
+    Single linear scan in row order; sums step lengths into ``out_dist[code]``.
+
+    The previous position is tracked per player, so rows may interleave players.
+    Steps touching a missing (NaN) position count as zero, as in the pandas path.
+    """
+    prev_x = np.full(out_dist.shape[0], np.nan)
+    prev_y = np.full(out_dist.shape[0], np.nan)
+    for i in range(codes.shape[0]):
+        k = codes[i]
+        if k < 0:                           # missing player_id
+            continue
+        dx = x[i] - prev_x[k]
+        dy = y[i] - prev_y[k]
+        step = math.sqrt(dx * dx + dy * dy)
+        if not math.isnan(step):            # also skips each player's first row
+            out_dist[k] += step
+        prev_x[k] = x[i]
+        prev_y[k] = y[i]
+
+
+def _count_high_speed_accel_pandas(
+    df: pd.DataFrame,
+    *,
+    min_speed: float,
+    min_accel: float,
+) -> pd.DataFrame:
+    """
+    Pure-pandas fallback for :func:`count_high_speed_accel` when Numba is unavailable.
+    """
     dt = 1.0 / FPS
     speed = df["speed"]
-    accel = speed.groupby(df["player_id"]).diff() / dt
+    accel = speed.groupby(df["player_id"], observed=True).diff() / dt
     qualifying = (
         (speed >= min_speed)
         & (accel >= min_accel)
     )
 
     # rising edges: True where current row qualifies and previous row didn't
-    rising = qualifying & (~qualifying.groupby(df["player_id"]).shift(fill_value=False))
+    prev_qualifying = qualifying.groupby(df["player_id"], observed=True).shift(fill_value=False)
+    rising = qualifying & ~prev_qualifying
 
     out = (
-        rising.groupby(df["player_id"])
+        rising.groupby(df["player_id"], observed=True)
         .sum()
         .astype("int16")
         .rename("n_accel")
         .reset_index()
     )
     return out
+
+
+@njit(cache=True)
+def _count_accels(codes, speed, min_speed, min_accel, dt, out_n):
+    """
+    Single scan in row order; counts rising edges of the
+    ``speed >= min_speed and accel >= min_accel`` condition into ``out_n[code]``.
+    """
+    prev_speed = np.full(out_n.shape[0], np.nan)
+    prev_qual = np.zeros(out_n.shape[0], np.bool_)
+    for i in range(codes.shape[0]):
+        k = codes[i]
+        if k < 0:                           # missing player_id
+            continue
+        # NaN on a player's first row (no previous sample) → not qualifying
+        accel = (speed[i] - prev_speed[k]) / dt
+        qual = speed[i] >= min_speed and accel >= min_accel
+        if qual and not prev_qual[k]:
+            out_n[k] += 1
+        prev_speed[k] = speed[i]
+        prev_qual[k] = qual
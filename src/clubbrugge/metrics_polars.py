@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import polars as pl
+
+from clubbrugge.metrics import FPS, _check_bands
+
+# --------------------------------------------------------------------------- #
+# Helper constants
+# --------------------------------------------------------------------------- #
+# chronological order of each player's samples
+_TIME_KEYS = ["player_id", "period_id", "frame_index"]
+
+
+# --------------------------------------------------------------------------- #
+# Public API
+# --------------------------------------------------------------------------- #
+def scan_tracking(parquet_file: str | Path) -> pl.LazyFrame:
+    """
+    Lazily scan the tracking Parquet written by :mod:`clubbrugge.io`.
+
+    Nothing is read until a metric collects, so projection pushdown only
+    loads the columns that metric needs.
+    """
+    return pl.scan_parquet(parquet_file)
+
+
+def total_distance(lf: pl.LazyFrame) -> pl.DataFrame:
+    """
+    Polars counterpart of :func:`clubbrugge.metrics.total_distance`.
+
+    Parameters
+    ----------
+    lf
+        Tracking LazyFrame with ``player_id, period_id, frame_index, x, y``.
+
+    Returns
+    -------
+    pl.DataFrame
+        Columns: ``player_id, distance_m``.
+    """
+    # NaN → null so gaps in the track contribute zero, as in the pandas path;
+    # float64 so the per-player sums don't lose precision over a full match
+    dx = pl.col("x").cast(pl.Float64).fill_nan(None).diff()
+    dy = pl.col("y").cast(pl.Float64).fill_nan(None).diff()
+    return (
+        lf.select(_TIME_KEYS + ["x", "y"])
+        .sort(_TIME_KEYS)
+        .group_by("player_id")
+        .agg((dx * dx + dy * dy).sqrt().sum().alias("distance_m"))
+        .sort("player_id")
+        .collect(engine="streaming")
+    )
+
+
+def distance_by_speed_band(
+    lf: pl.LazyFrame,
+    bands: Iterable[tuple[float, float]],
+) -> pl.DataFrame:
+    """
+    Polars counterpart of :func:`clubbrugge.metrics.distance_by_speed_band`.
+
+    All bands are aggregated in the same ``group_by`` so the speed column is
+    scanned once.
+
+    Returns
+    -------
+    pl.DataFrame
+        ``player_id`` plus one column per band, named ``"0-4"`` etc.
+    """
+    bands = list(bands)
+    _check_bands(bands)
+    speed = pl.col("speed")
+    dist = speed.cast(pl.Float64) / FPS             # distance = speed × time
+    aggs = [
+        dist.filter((speed > lo) & (speed <= hi)).sum().alias(
+            f"{lo}-{'' if np.isinf(hi) else hi}"
+        )
+        for lo, hi in bands
+    ]
+    return (
+        lf.select("player_id", "speed")
+        .group_by("player_id")
+        .agg(aggs)
+        .sort("player_id")
+        .collect(engine="streaming")
+    )
+
+
+def count_high_speed_accel(
+    lf: pl.LazyFrame,
+    *,
+    min_speed: float = 5.5,      # m/s  ≈ 19.8 km/h
+    min_accel: float = 3.0,      # m/s²
+) -> pl.DataFrame:
+    """
+    Polars counterpart of :func:`clubbrugge.metrics.count_high_speed_accel`.
+
+    Returns
+    -------
+    pl.DataFrame with ``player_id, n_accel``.
+    """
+    speed = pl.col("speed")
+    accel = speed.diff() / (1.0 / FPS)              # Δspeed / Δt
+    qualifying = ((speed >= min_speed) & (accel >= min_accel)).fill_null(False)
+    # rising edges: current row qualifies and previous row didn't
+    rising = qualifying & ~qualifying.shift(1, fill_value=False)
+    return (
+        lf.select(_TIME_KEYS + ["speed"])
+        .sort(_TIME_KEYS)
+        .group_by("player_id")
+        .agg(rising.sum().cast(pl.Int16).alias("n_accel"))
+        .sort("player_id")
+        .collect(engine="streaming")
+    )
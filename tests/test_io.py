@@ -4,14 +4,50 @@ Run with:  pytest -q
 """
 from pathlib import Path
 import json                              # <-- NEW
+import random
 import pandas as pd
-from clubbrugge.io import load_metadata, load_tracking_data
+import pyarrow.parquet as pq
+import pytest
+from clubbrugge.io import (
+    load_metadata,
+    load_tracking_data,
+    load_tracking_data_arrow,
+    load_tracking_parallel,
+    stream_tracking_to_parquet,
+    write_parquet,
+)
 
 ROOT = Path(__file__).resolve().parents[1]       # project root
 RAW_DIR = ROOT / "SourceFiles"                   # raw JSON / JSONL
 PARQUET_DIR = ROOT / "data"                      # generated Parquet files
 
 
+# --------------------------------------------------------------------------- #
+# Tiny synthetic feeds (no raw files needed)
+# --------------------------------------------------------------------------- #
+def _message(period, frame, xyz_overrides=None):
+    """One tracking line with two players per side; `xyz_overrides` maps playerId → xyz."""
+    xyz_overrides = xyz_overrides or {}
+
+    def player(pid, number):
+        xyz = xyz_overrides.get(pid, [float(frame), float(number), 0.0])
+        return {"playerId": pid, "number": number, "xyz": xyz, "speed": 0.5 * number}
+
+    return {
+        "period": period,
+        "frameIdx": frame,
+        "gameClock": frame / 25.0,
+        "wallClock": 1_700_000_000_000 + 40 * frame,
+        "homePlayers": [player("h1", 1), player("h2", 2)],
+        "awayPlayers": [player("a1", 1), player("a2", 2)],
+    }
+
+
+def _write_feed(path, messages):
+    path.write_text("".join(json.dumps(m) + "\n" for m in messages))
+    return path
+
+
 # --------------------------------------------------------------------------- #
 # Loader-level checks (raw → DataFrame)
 # --------------------------------------------------------------------------- #
@@ -78,6 +114,10 @@ def test_dtypes_and_missing_values():
     assert str(df.dtypes["period_id"]) == "int8"
     assert str(df.dtypes["frame_index"]) == "int32"
     assert str(df.dtypes["player_number"]) == "int8"
+    assert str(df.dtypes["wall_clock"]) == "int64"
+    assert str(df.dtypes["player_id"]) == "category"
+    for col in ("game_clock", "speed", "x", "y", "z"):
+        assert str(df.dtypes[col]) == "float32"
 
     assert df[["frame_index", "player_id", "speed"]].isna().sum().sum() == 0
     assert df[["x", "y"]].isna().mean().max() < 0.01
@@ -107,3 +147,78 @@ def test_row_count_and_ranges():
 
     # non-negative speeds
     assert (df["speed"] >= 0).all()
+
+
+def test_streaming_writer_matches_loader(tmp_path):
+    src = RAW_DIR / "tracking-produced.jsonl"
+    dst = tmp_path / "tracking.parquet"
+    stream_tracking_to_parquet(src, dst, chunk_size=50_000)
+
+    streamed = pd.read_parquet(dst)
+    loaded = load_tracking_data(src, chunk_size=50_000)
+    # category order follows first appearance on disk, values must match
+    pd.testing.assert_frame_equal(streamed, loaded, check_categorical=False)
+
+
+def test_parallel_loader_matches_loader():
+    src = RAW_DIR / "tracking-produced.jsonl"
+    parallel = load_tracking_parallel(src, n_workers=3)
+    serial = load_tracking_data(src)
+    pd.testing.assert_frame_equal(parallel, serial)
+
+
+def test_arrow_loader_matches_loader():
+    src = RAW_DIR / "tracking-produced.jsonl"
+    pd.testing.assert_frame_equal(load_tracking_data_arrow(src), load_tracking_data(src))
+
+
+def test_parallel_loader_sorts_out_of_order_feed(tmp_path):
+    messages = [_message(p, f) for p in (1, 2) for f in range(100 * p, 100 * p + 60)]
+    random.Random(0).shuffle(messages)
+    src = _write_feed(tmp_path / "shuffled.jsonl", messages)
+
+    parallel = load_tracking_parallel(src, n_workers=4)
+    assert parallel["frame_index"].is_monotonic_increasing
+    pd.testing.assert_frame_equal(parallel, load_tracking_data(src))
+
+
+def test_parallel_streaming_uses_chunk_sized_shards(tmp_path):
+    messages = [_message(1, f) for f in range(500)]
+    src = _write_feed(tmp_path / "feed.jsonl", messages)
+    serial = tmp_path / "serial.parquet"
+    parallel = tmp_path / "parallel.parquet"
+    # 202 is not a whole number of 4-player frames, so chunks overshoot it
+    stream_tracking_to_parquet(src, serial, chunk_size=202)
+    stream_tracking_to_parquet(src, parallel, chunk_size=202, n_workers=2)
+
+    # 2000 rows in ~200-row shards, not one shard per worker
+    assert pq.ParquetFile(parallel).num_row_groups >= 9
+    # each chunk is exactly one row group, with no small remainder groups
+    for path in (serial, parallel):
+        meta = pq.ParquetFile(path).metadata
+        sizes = [meta.row_group(i).num_rows for i in range(meta.num_row_groups)]
+        assert min(sizes[:-1]) >= 200
+    pd.testing.assert_frame_equal(pd.read_parquet(parallel), pd.read_parquet(serial))
+
+
+@pytest.mark.parametrize("codec", ["zstd", "snappy", "none"])
+def test_write_parquet_codecs(tmp_path, codec):
+    df = pd.DataFrame({"player_id": ["h1", "a1"], "x": [1.5, float("nan")]})
+    path = tmp_path / f"{codec}.parquet"
+    write_parquet(df, path, compression=codec)
+
+    codecs = {pq.ParquetFile(path).metadata.row_group(0).column(0).compression}
+    assert codecs == {"UNCOMPRESSED" if codec == "none" else codec.upper()}
+    pd.testing.assert_frame_equal(pd.read_parquet(path), df)
+
+
+def test_arrow_loader_handles_missing_and_empty_xyz(tmp_path):
+    messages = [_message(1, f) for f in range(5)]
+    messages[2] = _message(1, 2, {"h1": None, "a2": []})
+    src = _write_feed(tmp_path / "feed.jsonl", messages)
+
+    df = load_tracking_data_arrow(src)
+    missing = df[(df["frame_index"] == 2) & df["player_id"].isin(["h1", "a2"])]
+    assert len(missing) == 2
+    assert missing[["x", "y", "z"]].isna().all().all()
+    pd.testing.assert_frame_equal(df, load_tracking_data(src))
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pytest
 from clubbrugge.metrics import (
     total_distance,
     distance_by_speed_band,
@@ -52,3 +53,88 @@ def test_high_speed_accel():
     # synthetic clip uses constant speed → should yield zero events
     res = count_high_speed_accel(df_test, min_speed=5.5, min_accel=3.0)
     assert res["n_accel"].sum() == 0
+
+
+def test_total_distance_kernel_matches_pandas():
+    pytest.importorskip("numba")
+    from clubbrugge.metrics import _acc_dist, _total_distance_pandas
+
+    # interleaved players in frame order, with a missing position mid-clip
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "player_id": np.tile(["b", "a", "c"], 50),
+            "x": rng.uniform(-50, 50, 150),
+            "y": rng.uniform(-30, 30, 150),
+        }
+    )
+    df.loc[40, ["x", "y"]] = np.nan
+
+    # call the Numba kernel directly; total_distance may dispatch to Cython
+    codes, uniques = pd.factorize(df["player_id"], sort=True)
+    out = np.zeros(len(uniques))
+    _acc_dist(codes, df["x"].to_numpy(), df["y"].to_numpy(), out)
+    ref = _total_distance_pandas(df)
+    assert list(uniques) == list(ref["player_id"])
+    assert np.allclose(out, ref["distance_m"])
+
+
+def test_speed_band_edges_are_upper_inclusive():
+    df = pd.DataFrame({"player_id": [7, 7, 7, 7], "speed": [0.0, 4.0, 5.0, 8.0]})
+    res = distance_by_speed_band(df, [(0, 4), (4, 6)])
+
+    # 0 m/s lies outside (0, 4], 4 m/s in the lower band, 8 m/s in none
+    assert np.isclose(res["0-4"].item(), 4.0 * dt)
+    assert np.isclose(res["4-6"].item(), 5.0 * dt)
+
+
+def test_high_speed_accel_counts_rising_edges():
+    # 1 m/s per frame = 25 m/s²; the flat 7 → 7 step splits two bursts
+    speeds = [5.0, 6.0, 7.0, 7.0, 8.0, 9.0]
+    df = pd.DataFrame({"player_id": [1] * 6, "speed": speeds})
+    res = count_high_speed_accel(df, min_speed=5.5, min_accel=3.0)
+    assert res["n_accel"].item() == 2
+    assert res["n_accel"].dtype == "int16"
+
+
+def test_high_speed_accel_kernel_matches_pandas():
+    pytest.importorskip("numba")
+    from clubbrugge.metrics import _count_high_speed_accel_pandas
+
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(
+        {
+            "player_id": np.tile([3, 1, 2], 200),
+            "speed": rng.uniform(0, 9, 600).round(2),
+        }
+    )
+    res = count_high_speed_accel(df)
+    ref = _count_high_speed_accel_pandas(df, min_speed=5.5, min_accel=3.0)
+    pd.testing.assert_frame_equal(res, ref)
+
+
+def test_total_distance_extension_matches_pandas():
+    ext = pytest.importorskip("clubbrugge._metrics")
+    from clubbrugge.metrics import _total_distance_pandas
+
+    # enough rows for several parallel blocks, so block borders get stitched
+    rng = np.random.default_rng(3)
+    n = 400_003
+    x = rng.uniform(-50, 50, n).astype(np.float32)
+    y = rng.uniform(-30, 30, n).astype(np.float32)
+    x[[5, 200_000]] = y[[5, 200_000]] = np.nan
+    df = pd.DataFrame({"player_id": np.tile([4, 2, 9], n // 3 + 1)[:n], "x": x, "y": y})
+
+    codes, uniques = pd.factorize(df["player_id"], sort=True)
+    res = ext.total_distance_c(codes.astype(np.int64), x, y, len(uniques))
+    ref = _total_distance_pandas(df)
+    assert np.allclose(res, ref["distance_m"], rtol=1e-5)
+
+
+def test_total_distance_extension_rejects_bad_inputs():
+    ext = pytest.importorskip("clubbrugge._metrics")
+    xy = np.zeros(3, np.float32)
+    with pytest.raises(ValueError):
+        ext.total_distance_c(np.zeros(3, np.int64), xy, xy[:2], 1)
+    with pytest.raises(ValueError):
+        ext.total_distance_c(np.array([0, 1, 2], np.int64), xy, xy, 2)
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from clubbrugge import metrics, metrics_polars  # noqa: E402
+
+# two interleaved players over 300 frames, with a gap in one track
+rng = np.random.default_rng(2)
+n_frames = 300
+df_test = pd.DataFrame(
+    {
+        "period_id": 1,
+        "frame_index": np.repeat(np.arange(n_frames), 2),
+        "player_id": np.tile([202, 101], n_frames),
+        "speed": rng.uniform(0, 9, 2 * n_frames).round(2),
+        "x": rng.uniform(-50, 50, 2 * n_frames),
+        "y": rng.uniform(-30, 30, 2 * n_frames),
+    }
+)
+df_test.loc[17, ["x", "y"]] = np.nan
+lf_test = pl.from_pandas(df_test).lazy()
+
+
+def test_total_distance_matches_pandas():
+    res = metrics_polars.total_distance(lf_test)
+    ref = metrics.total_distance(df_test)
+    assert res["player_id"].to_list() == ref["player_id"].tolist()
+    assert np.allclose(res["distance_m"].to_numpy(), ref["distance_m"])
+
+
+def test_speed_band_matches_pandas():
+    bands = [(0, 4), (4, 5.5), (5.5, np.inf)]
+    res = metrics_polars.distance_by_speed_band(lf_test, bands)
+    ref = metrics.distance_by_speed_band(df_test, bands)
+    assert res.columns == list(ref.columns)
+    assert np.allclose(res.drop("player_id").to_numpy(), ref.drop(columns="player_id"))
+
+    # overlapping bands are rejected by both backends
+    for impl, data in ((metrics_polars, lf_test), (metrics, df_test)):
+        with pytest.raises(ValueError):
+            impl.distance_by_speed_band(data, [(0, 5), (4, 6)])
+
+
+def test_high_speed_accel_matches_pandas():
+    res = metrics_polars.count_high_speed_accel(lf_test)
+    ref = metrics.count_high_speed_accel(df_test)
+    assert res["n_accel"].dtype == pl.Int16
+    assert res["n_accel"].to_list() == ref["n_accel"].tolist()